@@ -32,20 +32,71 @@ Example:
 """
 from __future__ import annotations
 
-from collections.abc import Container
+import bisect
+import contextlib
+import functools
+import multiprocessing
+import sys
+import warnings
+from collections.abc import Callable
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
 
 SOLUTION = tuple[int, ...]
 """The indices which sum to the desired total."""
 
+MEET_IN_THE_MIDDLE_MAX_SIZE = 32
+"""Largest number of constituents to search with meet-in-the-middle."""
+
+
+def _solution_to_mask(solution: Iterable[int]) -> int:
+    """
+    Convert a collection of indices into a bitmask.
+
+    :param solution:
+        Indices to set in the mask.
+    :type solution:
+        Iterable[int]
+    :return:
+        Integer with bit ``i`` set for every index ``i``.
+    :rtype:
+        int
+    """
+    mask = 0
+    for index in solution:
+        mask |= 1 << index
+    return mask
+
+
+def _mask_to_solution(mask: int) -> SOLUTION:
+    """
+    Convert a bitmask into the sorted indices of its set bits.
+
+    :param mask:
+        Bitmask to convert.
+    :type mask:
+        int
+    :return:
+        Indices of the bits set in the mask.
+    :rtype:
+        SOLUTION
+    """
+    indices = []
+    while mask:
+        lowest_bit = mask & -mask
+        indices.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return tuple(indices)
+
 
 def read_floats_from_file(path: str) -> list[float]:
     """
     Read a list of floats from file.
 
     :param path:
-        Path contain values. Must have one float per line.
+        Path contain values. Must have one float per line,
+        blank lines are skipped.
     :type path:
         str
     :return:
@@ -53,25 +104,258 @@ def read_floats_from_file(path: str) -> list[float]:
     :rtype:
         list[float]
     """
-    values = []
     with open(path, "r") as in_file:
-        for line in in_file:
-            values.append(float(line.strip()))
-    return values
+        return [float(line) for line in in_file if line.strip()]
+
+
+def _scale_floats(values: Iterable[float], precision: int) -> list[int]:
+    """
+    Round floats to a number of decimals and scale them to integers.
+
+    :param values:
+        Floats to scale.
+    :type values:
+        Iterable[float]
+    :param precision:
+        Number of decimals to keep.
+    :type precision:
+        int
+    :return:
+        Each value rounded to `precision` decimals, multiplied by
+        ``10**precision``.
+    :rtype:
+        list[int]
+    """
+    scale = 10**precision
+    # Round before scaling: round(v, precision) is correctly rounded,
+    # whereas v * scale can land exactly on .5 and round the wrong way
+    # (e.g. 460.925 * 100 == 46092.5). After rounding, v * scale is
+    # within float error of an integer, so the outer round is exact.
+    return [round(round(v, precision) * scale) for v in values]
+
+
+def _subset_sums(
+    constituents: Sequence[int],
+    offset: int,
+) -> dict[int, list[int]]:
+    """
+    Find the sum of every subset of the constituents.
+
+    :param constituents:
+        Values to make subsets from.
+    :type constituents:
+        Sequence[int]
+    :param offset:
+        Index of the first constituent, used to set bits in the masks.
+    :type offset:
+        int
+    :return:
+        Mapping of each subset sum to the bitmasks of the subsets with
+        that sum, including the empty subset.
+    :rtype:
+        dict[int, list[int]]
+    """
+    subsets = [(0, 0)]
+    for index, constituent in enumerate(constituents, start=offset):
+        index_bit = 1 << index
+        subsets += [
+            (subtotal + constituent, mask | index_bit)
+            for subtotal, mask in subsets
+        ]
+    sums: dict[int, list[int]] = {}
+    for subtotal, mask in subsets:
+        sums.setdefault(subtotal, []).append(mask)
+    return sums
+
+
+def _meet_in_the_middle(
+    constituents: Sequence[int],
+) -> Callable[[int], list[int]]:
+    """
+    Build a function finding all possible combinations of integers which
+    sum to a total, by matching up the subset sums of each half of the
+    constituents.
+
+    The subset sums are tabulated once and reused for every total.
+    Takes O(2^(n/2)) time and memory regardless of the values, so is
+    only suitable for short lists of constituents.
+
+    :param constituents:
+        List of possible values that could sum to a total.
+    :type constituents:
+        Sequence[int]
+    :return:
+        Function taking a total and returning the possible solutions.
+        Each solution is a bitmask of the indices of the constituents
+        which can be summed to the total. Every solution is distinct.
+    :rtype:
+        Callable[[int], list[int]]
+    """
+    half = len(constituents) // 2
+    left_sums = _subset_sums(constituents[:half], offset=0)
+    right_sums = _subset_sums(constituents[half:], offset=half)
+
+    def _solve(total: int) -> list[int]:
+        solutions = []
+        for left_sum, left_masks in left_sums.items():
+            right_masks = right_sums.get(total - left_sum)
+            if right_masks:
+                solutions.extend(
+                    left_mask | right_mask
+                    for left_mask in left_masks
+                    for right_mask in right_masks
+                )
+        # The empty selection is not a solution, even for a total of 0.
+        return [mask for mask in solutions if mask]
+
+    return _solve
+
+
+def _make_solver(constituents: Sequence[int]) -> Callable[[int], list[int]]:
+    """
+    Build a function finding all possible combinations of integers
+    which sum to a total.
+
+    Sums of integers are exact, so no tolerance is needed. Work done
+    for one total is cached and reused for later totals.
+
+    :param constituents:
+        List of possible values that could sum to a total.
+    :type constituents:
+        Sequence[int]
+    :return:
+        Function taking a total and returning the possible solutions.
+        Each solution is a bitmask of the indices of the constituents
+        which can be summed to the total. Every solution is distinct.
+    :rtype:
+        Callable[[int], list[int]]
+    """
+    if len(constituents) <= MEET_IN_THE_MIDDLE_MAX_SIZE:
+        return _meet_in_the_middle(constituents)
+    return _backtrack(constituents)
+
+
+def _backtrack(constituents: Sequence[int]) -> Callable[[int], list[int]]:
+    """
+    Build a function finding all possible combinations of integers
+    which sum to a total, with a memoized depth first search.
+
+    Subproblems are cached by (start index, remaining total) and shared
+    between totals, so residuals common to several totals are only
+    solved once.
+
+    :param constituents:
+        List of possible values that could sum to a total.
+    :type constituents:
+        Sequence[int]
+    :return:
+        Function taking a total and returning the possible solutions.
+        Each solution is a bitmask of the indices of the constituents
+        which can be summed to the total. Every solution is distinct.
+    :rtype:
+        Callable[[int], list[int]]
+    """
+    # Positive values are searched first, with negative values only used
+    # to cover any overshoot, so each search only has values of one sign
+    # and can stop as soon as a value is too large. Both are searched in
+    # ascending order of magnitude.
+    order = sorted(
+        range(len(constituents)), key=lambda index: abs(constituents[index])
+    )
+    positive_indices = [i for i in order if constituents[i] >= 0]
+    negative_indices = [i for i in order if constituents[i] < 0]
+    positives = [constituents[i] for i in positive_indices]
+    negatives = [-constituents[i] for i in negative_indices]
+    positive_bits = [1 << i for i in positive_indices]
+    negative_bits = [1 << i for i in negative_indices]
+    n_positives = len(positives)
+    n_negatives = len(negatives)
+    # Sum of positives[i:] and negatives[i:], the largest total (or
+    # overshoot) which can be made from that suffix.
+    positive_sums = [0] * (n_positives + 1)
+    for index in reversed(range(n_positives)):
+        positive_sums[index] = positive_sums[index + 1] + positives[index]
+    negative_sums = [0] * (n_negatives + 1)
+    for index in reversed(range(n_negatives)):
+        negative_sums[index] = negative_sums[index + 1] + negatives[index]
+    max_overshoot = negative_sums[0]
+
+    @functools.lru_cache(maxsize=None)
+    def _solve_negatives(start_index: int, overshoot: int) -> tuple[int, ...]:
+        # All selections from negatives[start_index:] summing to
+        # -overshoot, including the empty selection when overshoot is 0.
+        if overshoot == 0:
+            return (0,)
+        if overshoot > negative_sums[start_index]:
+            return ()
+        # Values are ascending, so the ones small enough to use are
+        # found by bisection rather than tested one by one.
+        stop_index = bisect.bisect_right(negatives, overshoot, start_index)
+        solutions = []
+        for index in range(start_index, stop_index):
+            new_overshoot = overshoot - negatives[index]
+            index_bit = negative_bits[index]
+            solutions.extend(
+                index_bit | mask
+                for mask in _solve_negatives(index + 1, new_overshoot)
+            )
+        return tuple(solutions)
+
+    @functools.lru_cache(maxsize=None)
+    def _solve(start_index: int, total: int) -> tuple[int, ...]:
+        # All selections from positives[start_index:] and any negatives
+        # summing to total. Only depends on its arguments, so each is
+        # solved once. Selections are built in increasing index order, so
+        # no mask can be produced twice.
+        if not -max_overshoot <= total <= positive_sums[start_index]:
+            return ()
+        solutions = []
+        if total <= 0:
+            solutions.extend(_solve_negatives(0, -total))
+        stop_index = bisect.bisect_right(
+            positives, total + max_overshoot, start_index
+        )
+        for index in range(start_index, stop_index):
+            new_total = total - positives[index]
+            index_bit = positive_bits[index]
+            solutions.extend(
+                index_bit | mask for mask in _solve(index + 1, new_total)
+            )
+        return tuple(solutions)
+
+    def _solve_total(total: int) -> list[int]:
+        # The empty selection is not a solution, even for a total of 0.
+        return [mask for mask in _solve(0, total) if mask]
+
+    return _solve_total
+
+
+def _warn_tol_deprecated() -> None:
+    """
+    Warn that the ``tol`` argument is no longer used.
+    """
+    warnings.warn(
+        "'tol' is deprecated and ignored, values are rounded to "
+        "'precision' decimals and compared exactly.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
 
 
 def find_constituents(
     constituents: Sequence[float],
     total: float,
     *,
-    used_indices: Container[int] = ...,
     precision: int = 3,
-    tol: float = 1e-4,
+    tol: float | None = None,
 ) -> set[SOLUTION]:
     """
     Find all possible combinations of values which sum to
     the given total.
 
+    Values are rounded to `precision` decimals and scaled to
+    integers, so the search itself is exact.
+
     :param constituents:
         List of possible values that could sum to total.
     :type constituents:
@@ -80,17 +364,13 @@ def find_constituents(
         Total value to make from constituents.
     :type total:
         float
-    :param used_indices:
-        Indices which should be excluded from consideration.
-        Used for recursive calls, defaults to empty list.
-    :type used_indices:
-        Container[int], optional
     :param precision:
         Number of decimals with which to round floats to, defaults to 3.
     :type precision:
         int, optional
     :param tol:
-        Acceptable tolerance for comparing floats, defaults to 1e-4.
+        Deprecated and ignored, as values are compared exactly.
+        A DeprecationWarning is raised if given.
     :type tol:
         float, optional
     :return:
@@ -99,44 +379,68 @@ def find_constituents(
     :rtype:
         set[SOLUTION]
     """
-    if used_indices is Ellipsis:
-        used_indices = []
+    if tol is not None:
+        _warn_tol_deprecated()
+    solve = _make_solver(_scale_floats(constituents, precision))
+    (total_int,) = _scale_floats([total], precision)
+    return {_mask_to_solution(mask) for mask in solve(total_int)}
 
-    if used_indices:
-        last_index = used_indices[-1]
-    else:
-        last_index = -1
-    start_index = last_index + 1
-    total = round(total, precision)
-    min_remaining = min(
-        [c for i, c in enumerate(constituents) if i not in used_indices]
-    )
-    min_remaining = min(min_remaining, 0)
-    all_solutions = set()
-    for index, constituent in enumerate(constituents[start_index:]):
-        constituent = round(constituent, precision)
-        index += start_index
-        if constituent > total + tol + abs(min_remaining):
-            continue
-        if index in used_indices:
-            continue
-        new_total = total - constituent
-        if -tol <= new_total <= tol:
-            all_solutions.add(tuple(sorted(used_indices + [index])))
+
+def _iter_unique_solutions(
+    masks_per_total: Sequence[Sequence[int]],
+    used_mask: int = 0,
+) -> Iterator[list[int]]:
+    """
+    Iterate over the combinations of solutions, one for each total,
+    which do not reuse indices.
+
+    :param masks_per_total:
+        For each total, the bitmasks of its solutions.
+        Must contain at least one total.
+    :type masks_per_total:
+        Sequence[Sequence[int]]
+    :param used_mask:
+        Bitmask of indices which should be excluded, defaults to 0.
+    :type used_mask:
+        int, optional
+    :yield:
+        A unique solution, a list containing a bitmask for each total.
+    :rtype:
+        Iterator[list[int]]
+    """
+    n_totals = len(masks_per_total)
+    # Solutions using the most indices are explored first, as they
+    # conflict with the most solutions for later totals. The stack is
+    # LIFO, so these are pushed last.
+    masks_per_total = [
+        sorted(total_masks, key=lambda mask: bin(mask).count("1"))
+        for total_masks in masks_per_total
+    ]
+    # Each stack entry picks one mask for one total. Entries are popped
+    # depth first, so when an entry for a total is popped, chosen already
+    # holds its parents' masks and can be overwritten in place.
+    chosen = [0] * n_totals
+    stack = [
+        (0, used_mask, mask)
+        for mask in masks_per_total[0]
+        if not used_mask & mask
+    ]
+    while stack:
+        total_index, used_mask, mask = stack.pop()
+        chosen[total_index] = mask
+        used_mask |= mask
+        total_index += 1
+        if total_index == n_totals:
+            yield chosen.copy()
             continue
-        solutions = find_constituents(
-            constituents,
-            new_total,
-            used_indices=used_indices + [index],
-        )
-        for solution in solutions:
-            all_solutions.add(solution)
-    return all_solutions
+        for mask in masks_per_total[total_index]:
+            if not used_mask & mask:
+                stack.append((total_index, used_mask, mask))
 
 
 def filter_unique_solutions(
     solutions: Sequence[set(SOLUTION)],
-    used_indices: Container[int] = ...,
+    used_indices: Iterable[int] = ...,
 ) -> list[list[SOLUTION]]:
     """
     Given a list of solutions for multiple totals, and find
@@ -147,10 +451,10 @@ def filter_unique_solutions(
     :type solutions:
         Sequence[set(SOLUTION)]
     :param used_indices:
-        Indices which should be excluded from consideration.
-        Used for recursive calls, defaults to empty list.
+        Indices which should be excluded from consideration,
+        defaults to empty list.
     :type used_indices:
-        Container[int], optional
+        Iterable[int], optional
     :return:
         A list of unique solutions. Each element represents
         a unique solution. Each unique solution is a list
@@ -159,22 +463,23 @@ def filter_unique_solutions(
         list[list[SOLUTION]]
     """
     if used_indices is Ellipsis:
-        used_indices = set()
-
-    all_solutions = []
-    for solution in solutions[0]:
-        if any(i in used_indices for i in solution):
-            continue
-        if len(solutions) == 1:
-            all_solutions.append([solution])
-        else:
-            new_solutions = filter_unique_solutions(
-                solutions=solutions[1:],
-                used_indices=set([*used_indices, *solution]),
-            )
-            new_solutions = [[solution, *sol] for sol in new_solutions]
-            all_solutions.extend(new_solutions)
-    return all_solutions
+        used_indices = ()
+    if not solutions:
+        return []
+
+    # Represent each solution as a bitmask of its indices, so checking
+    # whether two solutions share an index is a single `&`.
+    masks_per_total = [
+        [_solution_to_mask(solution) for solution in total_solutions]
+        for total_solutions in solutions
+    ]
+    unique_masks = _iter_unique_solutions(
+        masks_per_total=masks_per_total,
+        used_mask=_solution_to_mask(used_indices),
+    )
+    return [
+        [_mask_to_solution(mask) for mask in masks] for masks in unique_masks
+    ]
 
 
 def print_unique_solutions(
@@ -198,23 +503,115 @@ def print_unique_solutions(
     :type totals:
         Sequence[float]
     """
+    # Build the whole output and write it at once, rather than making a
+    # print call for every line.
+    constituent_lines = [
+        f"\t\t{index}: {constituent}"
+        for index, constituent in enumerate(constituents)
+    ]
+    lines = []
     for sol_index, unique_sol in enumerate(unique_solutions):
-        print(f"Unique solution {sol_index+1}")
+        lines.append(f"Unique solution {sol_index+1}")
         for total_index, indices in enumerate(unique_sol):
-            print(f"\tInput total: {totals[total_index]}")
-            calc_total = 0
-            for index in indices:
-                calc_total += constituents[index]
-                print(f"\t\t{index}: {constituents[index]}")
-            print(f"\tCalculated total: {calc_total:.2f}\n")
+            lines.append(f"\tInput total: {totals[total_index]}")
+            lines.extend(constituent_lines[index] for index in indices)
+            calc_total = sum(constituents[index] for index in indices)
+            lines.append(f"\tCalculated total: {calc_total:.2f}\n")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+_worker_solve: Callable[[int], list[int]] | None = None
+"""Solver for the constituents, built once in each worker process."""
+
+
+def _init_worker(constituents: Sequence[int]) -> None:
+    """
+    Build the solver for a worker process.
+
+    :param constituents:
+        List of possible values that could sum to a total.
+    :type constituents:
+        Sequence[int]
+    """
+    global _worker_solve
+    _worker_solve = _make_solver(constituents)
+
+
+def _solve_in_worker(indexed_total: tuple[int, int]) -> tuple[int, list[int]]:
+    """
+    Find the solutions for a total with the worker process' solver.
+
+    :param indexed_total:
+        Position of the total in the list of totals, and the total.
+    :type indexed_total:
+        tuple[int, int]
+    :return:
+        Position of the total, and the bitmasks of its possible solutions.
+    :rtype:
+        tuple[int, list[int]]
+    """
+    index, total = indexed_total
+    return index, _worker_solve(total)
+
+
+def _solve_totals(
+    constituents: Sequence[int],
+    totals: Sequence[int],
+    *,
+    jobs: int | None = 1,
+) -> Iterator[tuple[int, list[int]]]:
+    """
+    Find the solutions for each total, optionally in parallel.
+
+    :param constituents:
+        List of possible values that could sum to total.
+    :type constituents:
+        Sequence[int]
+    :param totals:
+        Totals to make from constituents.
+    :type totals:
+        Sequence[int]
+    :param jobs:
+        Number of processes to use, None to use every CPU,
+        defaults to 1.
+    :type jobs:
+        int | None, optional
+    :yield:
+        Position of a total and the bitmasks of its possible solutions.
+        When run in parallel, totals are yielded as they finish.
+    :rtype:
+        Iterator[tuple[int, list[int]]]
+    """
+    if jobs == 1:
+        # The solver caches its work, which is reused across all totals.
+        yield from enumerate(map(_make_solver(constituents), totals))
+        return
+    # Each worker builds its own solver once and reuses it for every
+    # total it is given.
+    pool = multiprocessing.Pool(
+        processes=jobs,
+        initializer=_init_worker,
+        initargs=(constituents,),
+    )
+    try:
+        # Results arrive as they finish, so a total with no solutions
+        # is noticed without waiting for earlier totals.
+        yield from pool.imap_unordered(_solve_in_worker, enumerate(totals))
+    finally:
+        # Kill the workers, so totals which are no longer needed don't
+        # keep running (and keep the program from exiting).
+        pool.terminate()
+        pool.join()
 
 
 def find_unique_solutions(
     constituents: Sequence[float],
     totals: Sequence[float],
     *,
-    tol: float = 1e-4,
+    tol: float | None = None,
     precision: int = 3,
+    jobs: int | None = 1,
     show: bool = False,
 ) -> list[list[SOLUTION]]:
     """
@@ -222,6 +619,9 @@ def find_unique_solutions(
     `constituents` can be summed to make each total, without
     using a value from `constituents` more than once.
 
+    All values are rounded to `precision` decimals once, up front,
+    and the search itself works on exact integers.
+
     :param constituents:
         List of possible values that could sum to total.
     :type constituents:
@@ -231,13 +631,19 @@ def find_unique_solutions(
     :type totals:
         Sequence[float]
     :param tol:
-        Acceptable tolerance for comparing floats, defaults to 1e-4.
+        Deprecated and ignored, as values are compared exactly.
+        A DeprecationWarning is raised if given.
     :type tol:
         float, optional
     :param precision:
         Number of decimals with which to round floats to, defaults to 3.
     :type precision:
         int, optional
+    :param jobs:
+        Number of processes used to find the solutions for each total
+        in parallel, None to use every CPU, defaults to 1.
+    :type jobs:
+        int | None, optional
     :param show:
         Whether to print the solutions to console, defaults to False
     :type show:
@@ -249,17 +655,36 @@ def find_unique_solutions(
     :rtype:
         list[list[SOLUTION]]
     """
-    all_solutions: list[set(SOLUTION)] = [set() for _ in totals]
-    for index, total in enumerate(totals):
-        solutions = find_constituents(
-            constituents=constituents,
-            total=total,
-            tol=tol,
-            precision=precision,
-        )
-        all_solutions[index] = solutions
-    # Need to find the unique combination
-    unique_solutions = filter_unique_solutions(all_solutions)
+    if tol is not None:
+        _warn_tol_deprecated()
+    if not totals:
+        # With no totals there is nothing to find, as in
+        # filter_unique_solutions.
+        print("Found 0 unique solution(s)")
+        return []
+    # Scale everything to integers once, rather than once per total.
+    constituents_int = _scale_floats(constituents, precision)
+    totals_int = _scale_floats(totals, precision)
+    all_masks: list[list[int]] = [[] for _ in totals]
+    solutions_per_total = _solve_totals(
+        constituents_int, totals_int, jobs=jobs
+    )
+    with contextlib.closing(solutions_per_total):
+        for index, masks in solutions_per_total:
+            if not masks:
+                # No unique solution can exist if a total can't be made.
+                print("Found 0 unique solution(s)")
+                return []
+            all_masks[index] = masks
+    # Need to find the unique combination. Totals with the fewest
+    # solutions are searched first, to rule out combinations early.
+    order = sorted(range(len(totals)), key=lambda i: len(all_masks[i]))
+    unique_solutions = []
+    for masks in _iter_unique_solutions([all_masks[i] for i in order]):
+        unique_solution: list[SOLUTION] = [()] * len(totals)
+        for index, mask in zip(order, masks):
+            unique_solution[index] = _mask_to_solution(mask)
+        unique_solutions.append(unique_solution)
     n_unique = len(unique_solutions)
     print(f"Found {n_unique} unique solution(s)")
     if show:
@@ -319,10 +744,23 @@ def _test():
         show=True,
     )
 
+    # Only one solver is used for a given number of constituents, so
+    # check both agree on the same input.
+    constituents_int = _scale_floats(constituents, precision=3)
+    backtrack = _backtrack(constituents_int)
+    meet_in_the_middle = _meet_in_the_middle(constituents_int)
+    for total in _scale_floats([*totals, -666.8, -14.6, 367.2], precision=3):
+        backtrack_masks = sorted(backtrack(total))
+        meet_in_the_middle_masks = sorted(meet_in_the_middle(total))
+        assert backtrack_masks == meet_in_the_middle_masks, (
+            f"Solvers disagree for total {total}: "
+            f"{backtrack_masks} != {meet_in_the_middle_masks}"
+        )
+    print("Backtracking and meet-in-the-middle solvers agree.")
+
 
 def _main():
     import argparse
-    import sys
 
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
@@ -366,9 +804,12 @@ def _main():
         "--tolerance",
         nargs="?",
         type=float,
-        default=1e-4,
+        default=None,
         dest="tol",
-        help="Acceptable tolerance when comparing floats.",
+        help=(
+            "Deprecated and ignored. Values are rounded to '--precision' "
+            "decimals and compared exactly."
+        ),
     )
     parser.add_argument(
         "-p",
@@ -377,7 +818,19 @@ def _main():
         type=int,
         default=2,
         dest="precision",
-        help="Number of decimal places to round output to.",
+        help="Number of decimal places to round values and totals to.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        nargs="?",
+        type=int,
+        default=1,
+        dest="jobs",
+        help=(
+            "Number of processes used to search totals in parallel. "
+            "Give '-j' without a number to use every CPU."
+        ),
     )
     parser.add_argument(
         "-T",
@@ -396,6 +849,11 @@ def _main():
         _test()
         return
 
+    # Check the number of processes is valid (None means every CPU).
+    if parsed.jobs is not None and parsed.jobs < 1:
+        print("'--jobs' must be at least 1.")
+        sys.exit(1)
+
     # Check if values were given (or a path to values).
     values_given = bool(parsed.values)
     values_path_given = bool(parsed.values_path)
@@ -445,6 +903,7 @@ def _main():
         totals=totals,
         tol=parsed.tol,
         precision=parsed.precision,
+        jobs=parsed.jobs,
         show=True,
     )
 